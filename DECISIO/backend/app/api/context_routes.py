@@ -4,6 +4,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.api.dependencies import get_read_db
 from app.core.database import get_db
 from app.models.project_context import ProjectContext
 from app.schemas.project_context import (
@@ -50,7 +51,7 @@ def update_project_context(
 
 @router.get("", response_model=ProjectContextResponse)
 def get_project_context(
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> ProjectContextResponse:
     """Get current project context."""
     context = db.query(ProjectContext).order_by(
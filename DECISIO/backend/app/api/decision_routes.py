@@ -5,9 +5,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.api.dependencies import get_read_db
 from app.core.database import get_db
 from app.models.decision import Decision
-from app.schemas.decision import DecisionCreate, DecisionUpdate, DecisionResponse
+from app.schemas.decision import (
+    DecisionCreate,
+    DecisionUpdate,
+    DecisionResponse,
+    DecisionResponseList
+)
 
 router = APIRouter(prefix="/decisions", tags=["decisions"])
 
@@ -29,11 +35,11 @@ def create_decision(
 def get_decisions(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> List[DecisionResponse]:
     """Get all decisions."""
     decisions = db.query(Decision).offset(skip).limit(limit).all()
-    return [DecisionResponse.model_validate(d) for d in decisions]
+    return DecisionResponseList.validate_python(decisions, from_attributes=True)
 
 
 @router.get("/{decision_id}", response_model=DecisionResponse)
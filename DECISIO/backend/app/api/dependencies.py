@@ -0,0 +1,41 @@
+"""Request-scoped dependencies shared by the API routes."""
+
+import time
+from typing import Generator
+from fastapi import Request
+
+from app.core.config import get_settings
+from app.core.database import get_read_session_factory
+
+# Set after a write; while it is valid, reads go to the primary. The header
+# is echoed back by the frontend, which covers cross-site deployments where
+# the cookie is not sent.
+PRIMARY_STICKY_COOKIE = "decisio_primary_until"
+PRIMARY_STICKY_HEADER = "X-Decisio-Primary-Until"
+
+
+def wrote_recently(request: Request) -> bool:
+    """Check whether the client wrote within REPLICA_STICKY_SECONDS."""
+    value = (
+        request.headers.get(PRIMARY_STICKY_HEADER)
+        or request.cookies.get(PRIMARY_STICKY_COOKIE)
+    )
+    if not value:
+        return False
+    try:
+        primary_until = float(value)
+    except ValueError:
+        return False
+    # The marker comes from the client; anything further out than a fresh
+    # write could have produced is ignored so it can't pin reads forever.
+    now = time.time()
+    return now < primary_until <= now + get_settings().REPLICA_STICKY_SECONDS
+
+
+def get_read_db(request: Request) -> Generator:
+    """Dependency for read-only routes; uses a replica when configured."""
+    db = get_read_session_factory(use_primary=wrote_recently(request))()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -5,17 +5,28 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.api.dependencies import get_read_db
 from app.core.database import get_db
-from app.models.evaluation import DecisionContextSnapshot, DecisionEvaluation
+from app.models.evaluation import (
+    DecisionContextSnapshot,
+    DecisionEvaluation,
+    DecisionEvaluationArchive
+)
 from app.models.project_context import ProjectContext
 from app.schemas.evaluation import (
+    BatchEvaluationResponse,
     DecisionContextSnapshotCreate,
     DecisionContextSnapshotResponse,
-    DecisionEvaluationResponse
+    DecisionContextSnapshotResponseList,
+    DecisionEvaluationResponse,
+    DecisionEvaluationResponseList,
+    SnapshotSignatureGroupsResponse
 )
 from app.services.evaluation_service import EvaluationService
 
 router = APIRouter(prefix="/decisions", tags=["evaluations"])
+# Cross-decision operations; kept off /decisions so they can't collide with /decisions/{decision_id}
+batch_router = APIRouter(prefix="/evaluations", tags=["evaluations"])
 
 
 @router.get(
@@ -24,7 +35,7 @@ router = APIRouter(prefix="/decisions", tags=["evaluations"])
 )
 def get_decision_snapshots(
     decision_id: UUID,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> List[DecisionContextSnapshotResponse]:
     """Get all context snapshots for a decision (newest first)."""
     from app.models.decision import Decision
@@ -37,7 +48,7 @@ def get_decision_snapshots(
     snapshots = db.query(DecisionContextSnapshot).filter(
         DecisionContextSnapshot.decision_id == decision_id
     ).order_by(DecisionContextSnapshot.created_at.desc()).all()
-    return [DecisionContextSnapshotResponse.model_validate(s) for s in snapshots]
+    return DecisionContextSnapshotResponseList.validate_python(snapshots, from_attributes=True)
 
 
 @router.post(
@@ -97,11 +108,57 @@ def evaluate_decision(
 )
 def get_decision_evaluations(
     decision_id: UUID,
-    db: Session = Depends(get_db)
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_read_db)
 ) -> List[DecisionEvaluationResponse]:
-    """Get all evaluations for a decision."""
-    evaluations = db.query(DecisionEvaluation).filter(
+    """Get evaluations for a decision (newest first)."""
+    # Recent raw evaluations, then the downsampled archive. Compaction only
+    # archives rows older than everything left in the live table, so one
+    # page can run from the end of the live rows into the archive.
+    live = db.query(DecisionEvaluation).filter(
         DecisionEvaluation.decision_id == decision_id
-    ).order_by(DecisionEvaluation.evaluated_at.desc()).all()
+    )
+    evaluations = live.order_by(
+        DecisionEvaluation.evaluated_at.desc()
+    ).offset(skip).limit(limit).all()
+    
+    if len(evaluations) < limit:
+        # Rows of the live table that this page skipped entirely
+        archive_skip = 0 if evaluations else max(skip - live.count(), 0)
+        evaluations += db.query(DecisionEvaluationArchive).filter(
+            DecisionEvaluationArchive.decision_id == decision_id
+        ).order_by(
+            DecisionEvaluationArchive.evaluated_at.desc()
+        ).offset(archive_skip).limit(limit - len(evaluations)).all()
     
-    return [DecisionEvaluationResponse.model_validate(e) for e in evaluations]
+    return DecisionEvaluationResponseList.validate_python(evaluations, from_attributes=True)
+
+
+@batch_router.post(
+    "/batch",
+    response_model=BatchEvaluationResponse,
+    status_code=status.HTTP_201_CREATED
+)
+def evaluate_all_decisions(
+    db: Session = Depends(get_db)
+) -> BatchEvaluationResponse:
+    """Evaluate every decision, scoring each distinct snapshot signature once."""
+    try:
+        return EvaluationService.evaluate_all_decisions(db)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@batch_router.get(
+    "/signature-groups",
+    response_model=SnapshotSignatureGroupsResponse
+)
+def get_signature_groups(
+    db: Session = Depends(get_read_db)
+) -> SnapshotSignatureGroupsResponse:
+    """Get decisions grouped by latest snapshot signature (largest first)."""
+    return EvaluationService.get_signature_groups(db)
@@ -0,0 +1,338 @@
+"""
+Load generator with a configurable traffic mix.
+
+Replays context updates, snapshot creation, evaluations and list reads at
+a target request rate, then reports latency percentiles and error rates
+per route. Requests are scheduled open-loop: a slow server does not lower
+the offered rate.
+
+By default the app runs in-process through ASGI against a fresh SQLite
+file, so no network or PostgreSQL is needed; DATABASE_URL from the
+environment is ignored, pass --database-url to test another database.
+In that mode the database pool is sampled while the test runs. Pass
+--url to hit a live server.
+
+Usage:
+    python -m app.benchmarks.load_test --rps 50 --duration 30
+    python -m app.benchmarks.load_test --mix evaluate=5,list_decisions=1
+    python -m app.benchmarks.load_test --url http://localhost:8000 --rps 20
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+DEFAULT_MIX = {
+    "context": 1,
+    "snapshot": 2,
+    "evaluate": 3,
+    "list_decisions": 2,
+    "list_snapshots": 1,
+    "list_evaluations": 2,
+}
+
+API = "/api/v1"
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """Parse a mix like "evaluate=3,list_decisions=1" into weights."""
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(
+                f"unknown operation {name!r}; choose from {', '.join(DEFAULT_MIX)}"
+            )
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return 0.0
+    rank = max(math.ceil(pct * len(values) / 100) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+class RouteStats:
+    """Latencies and error count for one route."""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.errors = 0
+
+    def summary(self) -> dict:
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "error_rate": self.errors / count if count else 0.0,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+        }
+
+
+class PoolSampler:
+    """Samples checked-out connections of the in-process engine pool."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.samples: List[int] = []
+
+    @property
+    def capacity(self) -> Optional[int]:
+        size = getattr(self.pool, "size", None)
+        overflow = getattr(self.pool, "_max_overflow", None)
+        if size is None or overflow is None:
+            return None
+        return size() + max(overflow, 0)
+
+    async def run(self, interval: float = 0.05) -> None:
+        while True:
+            checkedout = getattr(self.pool, "checkedout", None)
+            if checkedout:
+                self.samples.append(checkedout())
+            await asyncio.sleep(interval)
+
+    def summary(self) -> dict:
+        capacity = self.capacity
+        peak = max(self.samples, default=0)
+        return {
+            "pool": type(self.pool).__name__,
+            "capacity": capacity,
+            "peak_checked_out": peak,
+            "mean_checked_out": sum(self.samples) / len(self.samples) if self.samples else 0.0,
+            "saturation": peak / capacity if capacity else None,
+        }
+
+
+class LoadTest:
+    """Runs a weighted mix of API operations at a target rate."""
+
+    def __init__(self, client: httpx.AsyncClient, mix: Dict[str, float], seed_decisions: int):
+        self.client = client
+        self.mix = mix
+        self.seed_decisions = seed_decisions
+        self.decision_ids: List[str] = []
+        self.stats: Dict[str, RouteStats] = {}
+
+    async def seed(self) -> None:
+        """Create project context and decisions with one snapshot each."""
+        response = await self.client.put(f"{API}/project-context", json={
+            "team_size": 8,
+            "expected_users": 5000,
+            "timeline_months": 12,
+        })
+        response.raise_for_status()
+        for i in range(self.seed_decisions):
+            response = await self.client.post(f"{API}/decisions", json={
+                "title": f"Load test decision {i}",
+                "description": "Seeded by app.benchmarks.load_test",
+                "decision_type": random.choice(["architecture", "technology", "process"]),
+                "confidence_level": random.choice(["low", "medium", "high"]),
+            })
+            response.raise_for_status()
+            decision_id = response.json()["id"]
+            self.decision_ids.append(decision_id)
+            response = await self.client.post(
+                f"{API}/decisions/{decision_id}/snapshot",
+                json=self._snapshot_payload()
+            )
+            response.raise_for_status()
+
+    @staticmethod
+    def _snapshot_payload() -> dict:
+        return {
+            "team_size_at_decision": random.randint(2, 20),
+            "expected_users_at_decision": random.choice([100, 1000, 5000, 20000]),
+            "timeline_at_decision": random.randint(3, 24),
+            "assumptions": "Generated by load test",
+        }
+
+    def _request(self, operation: str):
+        """Build (route label, method, path, json body) for an operation."""
+        decision_id = random.choice(self.decision_ids)
+        if operation == "context":
+            return "PUT /project-context", "PUT", f"{API}/project-context", {
+                "team_size": random.randint(2, 30),
+                "expected_users": random.choice([500, 5000, 50000]),
+            }
+        if operation == "snapshot":
+            return (
+                "POST /decisions/{id}/snapshot", "POST",
+                f"{API}/decisions/{decision_id}/snapshot", self._snapshot_payload()
+            )
+        if operation == "evaluate":
+            return (
+                "POST /decisions/{id}/evaluate", "POST",
+                f"{API}/decisions/{decision_id}/evaluate", None
+            )
+        if operation == "list_decisions":
+            return "GET /decisions", "GET", f"{API}/decisions", None
+        if operation == "list_snapshots":
+            return (
+                "GET /decisions/{id}/snapshots", "GET",
+                f"{API}/decisions/{decision_id}/snapshots", None
+            )
+        return (
+            "GET /decisions/{id}/evaluations", "GET",
+            f"{API}/decisions/{decision_id}/evaluations", None
+        )
+
+    async def _fire(self, operation: str) -> None:
+        route, method, path, body = self._request(operation)
+        stats = self.stats.setdefault(route, RouteStats())
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, json=body)
+            failed = response.status_code >= 400
+        except httpx.HTTPError:
+            failed = True
+        stats.latencies.append(time.perf_counter() - start)
+        if failed:
+            stats.errors += 1
+
+    async def run(self, rps: float, duration: float) -> float:
+        """
+        Offer `rps` requests per second for `duration` seconds.
+
+        Returns:
+            Wall-clock seconds until every request finished
+        """
+        operations = list(self.mix)
+        weights = [self.mix[o] for o in operations]
+        total = int(rps * duration)
+        tasks = []
+        start = time.perf_counter()
+        for i in range(total):
+            delay = start + i / rps - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            operation = random.choices(operations, weights)[0]
+            tasks.append(asyncio.create_task(self._fire(operation)))
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - start
+
+
+def print_report(report: dict) -> None:
+    """Print a load test report as a table."""
+    print(
+        f"Offered {report['target_rps']:.1f} rps for {report['duration_s']:.0f}s, "
+        f"achieved {report['achieved_rps']:.1f} rps over {report['elapsed_s']:.1f}s"
+    )
+    print(f"{'route':<34}{'requests':>9}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for route, s in sorted(report["routes"].items()):
+        print(
+            f"{route:<34}{s['requests']:>9}{s['errors']:>8}"
+            f"{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}{s['p99_ms']:>9.1f}"
+        )
+    print(f"Overall error rate: {report['error_rate']:.2%}")
+    pool = report.get("db_pool")
+    if pool:
+        saturation = pool["saturation"]
+        print(
+            f"DB pool ({pool['pool']}): peak {pool['peak_checked_out']}"
+            f"/{pool['capacity'] or '?'} checked out, "
+            f"mean {pool['mean_checked_out']:.1f}"
+            + (f", saturation {saturation:.0%}" if saturation is not None else "")
+        )
+    else:
+        print("DB pool: not observable against a live URL")
+
+
+async def main_async(args: argparse.Namespace) -> dict:
+    sampler = None
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+    else:
+        # Configure the in-process app before anything reads settings. An
+        # exported DATABASE_URL (e.g. inside the backend container) is
+        # ignored so the test never writes into a real database by accident.
+        database_url = args.database_url
+        if not database_url:
+            path = os.path.join(tempfile.mkdtemp(prefix="decisio-load-"), "load.db")
+            database_url = f"sqlite:///{path}"
+        os.environ["DATABASE_URL"] = database_url
+        os.environ["DATABASE_REPLICA_URLS"] = ""
+        from app.core.database import get_engine
+        from app.core.init_db import init_db
+        from app.main import create_app
+
+        # Keep stdout clean for the report (and valid for --json)
+        with contextlib.redirect_stdout(sys.stderr):
+            init_db()
+        application = create_app()
+        client = httpx.AsyncClient(
+            # Report app exceptions (e.g. pool timeouts) as 500s, like a server would
+            transport=httpx.ASGITransport(app=application, raise_app_exceptions=False),
+            base_url="http://loadtest",
+            timeout=args.timeout
+        )
+        sampler = PoolSampler(get_engine().pool)
+
+    async with client:
+        test = LoadTest(client, args.mix, args.seed_decisions)
+        await test.seed()
+        sampling = asyncio.create_task(sampler.run()) if sampler else None
+        elapsed = await test.run(args.rps, args.duration)
+        if sampling:
+            sampling.cancel()
+
+    routes = {route: s.summary() for route, s in test.stats.items()}
+    requests = sum(r["requests"] for r in routes.values())
+    errors = sum(r["errors"] for r in routes.values())
+    return {
+        "target_rps": args.rps,
+        "duration_s": args.duration,
+        "elapsed_s": elapsed,
+        "achieved_rps": requests / elapsed if elapsed else 0.0,
+        "error_rate": errors / requests if requests else 0.0,
+        "routes": routes,
+        "db_pool": sampler.summary() if sampler else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the Decisio API.")
+    parser.add_argument("--url", help="base URL of a live server; default runs the app in-process")
+    parser.add_argument(
+        "--database-url",
+        help="database for the in-process app; default is a temporary SQLite file, "
+             "even if DATABASE_URL is set"
+    )
+    parser.add_argument("--rps", type=float, default=20, help="target requests per second")
+    parser.add_argument("--duration", type=float, default=10, help="seconds of load")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help=f"operation weights, e.g. evaluate=3,list_decisions=1 (operations: {', '.join(DEFAULT_MIX)})"
+    )
+    parser.add_argument("--seed-decisions", type=int, default=20, help="decisions created before the run")
+    parser.add_argument("--timeout", type=float, default=30, help="per-request timeout in seconds")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
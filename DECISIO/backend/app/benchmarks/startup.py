@@ -0,0 +1,134 @@
+"""
+Startup benchmark for the API process.
+
+Each run starts a fresh interpreter so imports are cold, then measures:
+- import: time to import `app.main`, which imports the routers, models
+  and schemas and builds the app, as `uvicorn app.main:app` does
+- first_request: time for app startup (lifespan) and the first
+  `GET /health` through ASGI
+- total: time from the first app import to the first response
+
+Usage:
+    python -m app.benchmarks.startup --runs 5
+    python -m app.benchmarks.startup --importtime 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+# Runs inside the child interpreter and prints one JSON line of timings
+_PROBE = """
+import asyncio, json, time
+import httpx
+t0 = time.perf_counter()
+import app.main
+application = app.main.app
+t1 = time.perf_counter()
+
+async def first_request():
+    # ASGITransport sends no lifespan events; run startup explicitly so
+    # it counts toward time to first request
+    async with application.router.lifespan_context(application):
+        transport = httpx.ASGITransport(app=application)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.get("/health")
+            response.raise_for_status()
+            t2 = time.perf_counter()
+    return t2
+
+t2 = asyncio.run(first_request())
+print(json.dumps({
+    "import": t1 - t0,
+    "first_request": t2 - t1,
+    "total": t2 - t0,
+}))
+"""
+
+PHASES = ["import", "first_request", "total"]
+
+
+def run_probe() -> Dict[str, float]:
+    """Measure one cold start in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ.copy()
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def import_profile(top: int) -> List[tuple]:
+    """
+    Profile `app.main` imports with `python -X importtime`.
+
+    Returns:
+        List of (cumulative_us, self_us, module) for the slowest imports
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         "import app.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ.copy()
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), module.rstrip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure Decisio cold start time.")
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts")
+    parser.add_argument(
+        "--importtime",
+        type=int,
+        default=0,
+        metavar="N",
+        help="also print the N slowest imports"
+    )
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    samples = [run_probe() for _ in range(args.runs)]
+    summary = {
+        phase: {
+            "median_ms": statistics.median(s[phase] for s in samples) * 1000,
+            "max_ms": max(s[phase] for s in samples) * 1000,
+        }
+        for phase in PHASES
+    }
+
+    if args.json:
+        print(json.dumps({"runs": args.runs, "phases": summary}, indent=2))
+    else:
+        print(f"Cold start over {args.runs} runs")
+        print(f"{'phase':<15}{'median ms':>12}{'max ms':>12}")
+        for phase in PHASES:
+            print(
+                f"{phase:<15}{summary[phase]['median_ms']:>12.1f}"
+                f"{summary[phase]['max_ms']:>12.1f}"
+            )
+
+    if args.importtime:
+        print()
+        print(f"Slowest {args.importtime} imports (cumulative)")
+        print(f"{'cumulative ms':>14}{'self ms':>10}  module")
+        for cumulative_us, self_us, module in import_profile(args.importtime):
+            print(f"{cumulative_us / 1000:>14.1f}{self_us / 1000:>10.1f}  {module}")
+
+
+if __name__ == "__main__":
+    main()
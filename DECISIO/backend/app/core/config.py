@@ -1,6 +1,8 @@
 """Application configuration using environment variables."""
 
 import json
+from functools import lru_cache
+from typing import Literal
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
 
@@ -22,6 +24,28 @@ class Settings(BaseSettings):
     # - Comma-separated:   "https://example.com,https://www.example.com"
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:8000"]
 
+    # Read replica settings
+    # Kept as a plain string so a single DSN needs no JSON quoting; see
+    # replica_urls for the accepted formats. Empty means every query uses
+    # DATABASE_URL.
+    DATABASE_REPLICA_URLS: str = ""
+    # Seconds a client keeps reading from the primary after a write
+    REPLICA_STICKY_SECONDS: int = 5
+
+    # Evaluation history retention
+    # Raw evaluations older than this are downsampled into the archive
+    EVALUATION_RETENTION_DAYS: int = 90
+    # Archive bucket size: "day" or "week"
+    EVALUATION_DOWNSAMPLE_BUCKET: Literal["day", "week"] = "day"
+    # Seconds between background compaction runs; 0 disables the task.
+    # Runs are serialised with an advisory lock on PostgreSQL only; on other
+    # databases set this in a single process.
+    EVALUATION_COMPACTION_INTERVAL_SECONDS: int = 0
+
+    # Startup settings
+    # Run init_db() from the app lifespan instead of as a separate script
+    CREATE_TABLES_ON_STARTUP: bool = False
+
     @field_validator("CORS_ORIGINS", mode="before")
     @classmethod
     def _parse_cors_origins(cls, v):
@@ -44,10 +68,36 @@ class Settings(BaseSettings):
             # Comma-separated
             return [part.strip() for part in s.split(",") if part.strip()]
         return v
+
+    @property
+    def replica_urls(self) -> list[str]:
+        """
+        Read replica DSNs parsed from DATABASE_REPLICA_URLS.
+
+        Accepts:
+        - A single DSN:      "postgresql://replica1/decisio"
+        - Comma-separated:   "postgresql://replica1/decisio,postgresql://replica2/decisio"
+        - JSON array string: '["postgresql://replica1/decisio"]' (for DSNs containing commas)
+        """
+        s = self.DATABASE_REPLICA_URLS.strip()
+        if s.startswith("["):
+            return [str(x).strip() for x in json.loads(s) if str(x).strip()]
+        return [part.strip() for part in s.split(",") if part.strip()]
     
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Build settings on first use instead of at import time."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Keep `from app.core.config import settings` working without
+    # reading the environment when this module is imported.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,30 +1,83 @@
 """Database configuration and session management."""
 
+import itertools
+from functools import lru_cache
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from typing import Generator
+from typing import Generator, Tuple
 
-from app.core.config import settings
-
-# Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=False  # Set to True for SQL query logging
-)
-
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from app.core.config import get_settings
 
 # Base class for models
 Base = declarative_base()
 
+# Round-robin position across replicas
+_replica_counter = itertools.count()
+
+
+@lru_cache
+def get_engine() -> Engine:
+    """Create the database engine on first use."""
+    return create_engine(
+        get_settings().DATABASE_URL,
+        pool_pre_ping=True,
+        echo=False  # Set to True for SQL query logging
+    )
+
+
+@lru_cache
+def get_session_factory() -> sessionmaker:
+    """Create the session factory on first use."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+@lru_cache
+def get_replica_session_factories() -> Tuple[sessionmaker, ...]:
+    """Create one session factory per configured read replica."""
+    return tuple(
+        sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=create_engine(url, pool_pre_ping=True, echo=False)
+        )
+        for url in get_settings().replica_urls
+    )
+
+
+def get_read_session_factory(use_primary: bool = False) -> sessionmaker:
+    """
+    Pick a session factory for a read-only request.
+
+    Args:
+        use_primary: Force the primary, e.g. right after the client wrote
+
+    Returns:
+        The next replica in round-robin order, or the primary if there are
+        no replicas or use_primary is set
+    """
+    replicas = get_replica_session_factories()
+    if use_primary or not replicas:
+        return get_session_factory()
+    return replicas[next(_replica_counter) % len(replicas)]
+
+
+def __getattr__(name: str):
+    # Keep `engine` and `SessionLocal` importable without connecting
+    # to the database when this module is imported.
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_db() -> Generator:
     """Dependency for getting database session."""
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     finally:
         db.close()
+
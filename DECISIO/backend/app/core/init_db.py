@@ -1,14 +1,24 @@
 """Initialize database tables."""
 
-from app.core.database import Base, engine
+from app.core.database import Base, get_engine
 from app.models.decision import Decision
 from app.models.project_context import ProjectContext
-from app.models.evaluation import DecisionContextSnapshot, DecisionEvaluation
+from app.models.evaluation import (
+    DecisionContextSnapshot,
+    DecisionEvaluation,
+    DecisionEvaluationArchive
+)
 
 
 def init_db():
-    """Create all database tables."""
+    """Create all database tables and any indexes missing from existing ones."""
+    engine = get_engine()
     Base.metadata.create_all(bind=engine)
+    # create_all skips tables that already exist, including indexes added
+    # to them later (e.g. decision_evaluations (decision_id, evaluated_at))
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
     print("Database tables created successfully!")
 
 
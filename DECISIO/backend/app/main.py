@@ -1,44 +1,114 @@
 """Main FastAPI application."""
 
-from fastapi import FastAPI
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.core.config import settings
 from app.api import decision_routes, context_routes, evaluation_routes
+from app.api.dependencies import PRIMARY_STICKY_COOKIE, PRIMARY_STICKY_HEADER
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+async def compact_periodically(interval: int) -> None:
+    """Run evaluation history compaction every `interval` seconds."""
+    from app.services.retention_service import run_compaction
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(run_compaction)
+        except Exception:
+            logger.exception("Evaluation compaction failed")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run optional startup work before serving requests."""
+    settings = get_settings()
+    if settings.CREATE_TABLES_ON_STARTUP:
+        from app.core.init_db import init_db
+        init_db()
+
+    compaction = None
+    if settings.EVALUATION_COMPACTION_INTERVAL_SECONDS > 0:
+        compaction = asyncio.create_task(
+            compact_periodically(settings.EVALUATION_COMPACTION_INTERVAL_SECONDS)
+        )
+    yield
+    if compaction:
+        compaction.cancel()
+
+
+def create_app() -> FastAPI:
+    """Build the FastAPI application."""
+    settings = get_settings()
+
+    # Initialize FastAPI app
+    app = FastAPI(
+        title=settings.PROJECT_NAME,
+        version=settings.VERSION,
+        description="Decision Intelligence Platform API",
+        lifespan=lifespan
+    )
+
+    # Configure CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        # Lets cross-site frontends read the read-your-writes marker
+        expose_headers=[PRIMARY_STICKY_HEADER],
+    )
+
+    # Read-your-writes: after a successful write, keep this client's reads
+    # on the primary until replicas have had time to catch up
+    if settings.replica_urls:
+
+        @app.middleware("http")
+        async def stick_to_primary_after_write(request: Request, call_next):
+            response = await call_next(request)
+            if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+                primary_until = str(time.time() + settings.REPLICA_STICKY_SECONDS)
+                response.headers[PRIMARY_STICKY_HEADER] = primary_until
+                response.set_cookie(
+                    PRIMARY_STICKY_COOKIE,
+                    primary_until,
+                    max_age=settings.REPLICA_STICKY_SECONDS,
+                    httponly=True,
+                    samesite="lax"
+                )
+            return response
+
+    # Include routers
+    app.include_router(decision_routes.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(context_routes.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(evaluation_routes.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(evaluation_routes.batch_router, prefix=settings.API_V1_PREFIX)
+
+    @app.get("/health")
+    def health_check():
+        """Health check endpoint."""
+        return {"status": "healthy", "service": "Decisio API"}
+
+    @app.get("/")
+    def root():
+        """Root endpoint."""
+        return {
+            "message": "Welcome to Decisio API",
+            "docs": "/docs",
+            "health": "/health"
+        }
+
+    return app
+
+
 
-# Initialize FastAPI app
-app = FastAPI(
-    title=settings.PROJECT_NAME,
-    version=settings.VERSION,
-    description="Decision Intelligence Platform API"
-)
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers
-app.include_router(decision_routes.router, prefix=settings.API_V1_PREFIX)
-app.include_router(context_routes.router, prefix=settings.API_V1_PREFIX)
-app.include_router(evaluation_routes.router, prefix=settings.API_V1_PREFIX)
-
-
-@app.get("/health")
-def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": "Decisio API"}
-
-
-@app.get("/")
-def root():
-    """Root endpoint."""
-    return {
-        "message": "Welcome to Decisio API",
-        "docs": "/docs",
-        "health": "/health"
-    }
+app = create_app()
@@ -2,8 +2,7 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Uuid, String, Text, DateTime, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 import enum
 
@@ -29,7 +28,7 @@ class Decision(Base):
     
     __tablename__ = "decisions"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
     decision_type = Column(SQLEnum(DecisionType), nullable=False)
@@ -40,3 +39,4 @@ class Decision(Base):
     # Relationships
     snapshots = relationship("DecisionContextSnapshot", back_populates="decision", cascade="all, delete-orphan")
     evaluations = relationship("DecisionEvaluation", back_populates="decision", cascade="all, delete-orphan")
+    archived_evaluations = relationship("DecisionEvaluationArchive", back_populates="decision", cascade="all, delete-orphan")
@@ -2,8 +2,7 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Uuid, Integer, Text, DateTime, ForeignKey, Index, String, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 import enum
 
@@ -22,8 +21,8 @@ class DecisionContextSnapshot(Base):
     
     __tablename__ = "decision_context_snapshots"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    decision_id = Column(UUID(as_uuid=True), ForeignKey("decisions.id"), nullable=False)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    decision_id = Column(Uuid, ForeignKey("decisions.id"), nullable=False)
     team_size_at_decision = Column(Integer, nullable=False)
     expected_users_at_decision = Column(Integer, nullable=False)
     timeline_at_decision = Column(Integer, nullable=False)
@@ -35,12 +34,23 @@ class DecisionContextSnapshot(Base):
 
 
 class DecisionEvaluation(Base):
-    """Evaluation result for a decision showing drift and risk."""
+    """
+    Evaluation result for a decision showing drift and risk.
+
+    Not partitioned: compaction keeps this table to roughly
+    EVALUATION_RETENTION_DAYS of raw rows, and a partitioned table would
+    need (id, evaluated_at) as its primary key, which create_all cannot
+    migrate an existing table to. Old history is partitioned in the archive.
+    """
     
     __tablename__ = "decision_evaluations"
+    __table_args__ = (
+        # Serves the newest-first history query per decision
+        Index("ix_decision_evaluations_decision_id_evaluated_at", "decision_id", "evaluated_at"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    decision_id = Column(UUID(as_uuid=True), ForeignKey("decisions.id"), nullable=False)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    decision_id = Column(Uuid, ForeignKey("decisions.id"), nullable=False)
     drift_score = Column(Integer, nullable=False)  # 0-100
     risk_level = Column(SQLEnum(RiskLevel), nullable=False)
     explanation = Column(Text, nullable=False)
@@ -48,3 +58,33 @@ class DecisionEvaluation(Base):
     
     # Relationships
     decision = relationship("Decision", back_populates="evaluations")
+
+
+class DecisionEvaluationArchive(Base):
+    """
+    Downsampled evaluation history older than the retention window.
+
+    Each row is the latest evaluation of a decision within one day or week
+    bucket. On PostgreSQL the table is range-partitioned by month on
+    evaluated_at; other databases use it as a plain table.
+    """
+    
+    __tablename__ = "decision_evaluation_archive"
+    __table_args__ = (
+        Index("ix_decision_evaluation_archive_decision_id_evaluated_at", "decision_id", "evaluated_at"),
+        {"postgresql_partition_by": "RANGE (evaluated_at)"},
+    )
+    
+    # The partition key must be part of the primary key on PostgreSQL
+    id = Column(Uuid, primary_key=True)
+    evaluated_at = Column(DateTime, primary_key=True)
+    decision_id = Column(Uuid, ForeignKey("decisions.id"), nullable=False)
+    drift_score = Column(Integer, nullable=False)  # 0-100
+    risk_level = Column(SQLEnum(RiskLevel), nullable=False)
+    explanation = Column(Text, nullable=False)
+    bucket = Column(String(8), nullable=False)  # "day" or "week"
+    sample_count = Column(Integer, nullable=False)  # evaluations folded into this row
+    max_drift_score = Column(Integer, nullable=False)  # highest score in the bucket
+    
+    # Relationships
+    decision = relationship("Decision", back_populates="archived_evaluations")
@@ -2,8 +2,7 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, Integer, Text, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Uuid, Integer, Text, DateTime
 
 from app.core.database import Base
 
@@ -13,7 +12,7 @@ class ProjectContext(Base):
     
     __tablename__ = "project_contexts"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     team_size = Column(Integer, nullable=False)
     expected_users = Column(Integer, nullable=False)
     timeline_months = Column(Integer, nullable=False)
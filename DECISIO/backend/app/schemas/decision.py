@@ -1,8 +1,8 @@
 """Pydantic schemas for Decision model."""
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
 from uuid import UUID
 
 from app.models.decision import DecisionType, ConfidenceLevel
@@ -37,3 +37,8 @@ class DecisionResponse(DecisionBase):
     
     class Config:
         from_attributes = True
+
+
+# Validates a whole list of ORM rows in one call instead of one
+# model_validate() per row
+DecisionResponseList = TypeAdapter(List[DecisionResponse])
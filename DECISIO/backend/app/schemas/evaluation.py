@@ -1,8 +1,8 @@
 """Pydantic schemas for evaluation models."""
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
 from uuid import UUID
 
 from app.models.evaluation import RiskLevel
@@ -48,6 +48,39 @@ class DecisionEvaluationResponse(DecisionEvaluationBase):
     id: UUID
     decision_id: UUID
     evaluated_at: datetime
+    # Only set for downsampled history from the archive
+    bucket: Optional[str] = None
+    sample_count: Optional[int] = None
+    max_drift_score: Optional[int] = None
     
     class Config:
         from_attributes = True
+
+
+class BatchEvaluationResponse(BaseModel):
+    """Schema for evaluating every decision in one pass."""
+    decisions_evaluated: int
+    distinct_signatures: int
+    evaluations: List[DecisionEvaluationResponse]
+
+
+class SnapshotSignatureGroup(BaseModel):
+    """Decisions whose latest snapshots share the same context triple."""
+    team_size_at_decision: int
+    expected_users_at_decision: int
+    timeline_at_decision: int
+    decision_count: int
+    decision_ids: List[UUID]
+
+
+class SnapshotSignatureGroupsResponse(BaseModel):
+    """Schema for snapshot signature groups, largest first."""
+    total_decisions: int
+    distinct_signatures: int
+    groups: List[SnapshotSignatureGroup]
+
+
+# Validate a whole list of ORM rows in one call instead of one
+# model_validate() per row
+DecisionContextSnapshotResponseList = TypeAdapter(List[DecisionContextSnapshotResponse])
+DecisionEvaluationResponseList = TypeAdapter(List[DecisionEvaluationResponse])
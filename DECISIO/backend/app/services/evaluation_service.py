@@ -1,6 +1,10 @@
 """Service for evaluating decisions."""
 
+import uuid
+from datetime import datetime
+from typing import Dict, List, Tuple
 from uuid import UUID
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import NoResultFound
 
@@ -8,7 +12,25 @@ from app.models.decision import Decision
 from app.models.project_context import ProjectContext
 from app.models.evaluation import DecisionContextSnapshot, DecisionEvaluation
 from app.services.drift_engine import calculate_drift_score
-from app.schemas.evaluation import DecisionEvaluationResponse
+from app.schemas.evaluation import (
+    BatchEvaluationResponse,
+    DecisionEvaluationResponse,
+    DecisionEvaluationResponseList,
+    SnapshotSignatureGroup,
+    SnapshotSignatureGroupsResponse
+)
+
+# (team_size_at_decision, expected_users_at_decision, timeline_at_decision)
+SnapshotSignature = Tuple[int, int, int]
+
+
+def snapshot_signature(snapshot: DecisionContextSnapshot) -> SnapshotSignature:
+    """Return the snapshot fields that the drift score depends on."""
+    return (
+        snapshot.team_size_at_decision,
+        snapshot.expected_users_at_decision,
+        snapshot.timeline_at_decision
+    )
 
 
 class EvaluationService:
@@ -75,3 +97,117 @@ class EvaluationService:
         db.refresh(evaluation)
         
         return DecisionEvaluationResponse.model_validate(evaluation)
+    
+    @staticmethod
+    def latest_snapshots(db: Session) -> List[DecisionContextSnapshot]:
+        """Fetch the latest context snapshot of every decision in one query."""
+        latest = db.query(
+            DecisionContextSnapshot.decision_id,
+            func.max(DecisionContextSnapshot.created_at).label("created_at")
+        ).group_by(DecisionContextSnapshot.decision_id).subquery()
+        
+        snapshots = db.query(DecisionContextSnapshot).join(
+            latest,
+            (DecisionContextSnapshot.decision_id == latest.c.decision_id)
+            & (DecisionContextSnapshot.created_at == latest.c.created_at)
+        ).all()
+        
+        # Keep one snapshot per decision if two share a timestamp
+        return list({s.decision_id: s for s in snapshots}.values())
+    
+    @staticmethod
+    def group_by_signature(
+        snapshots: List[DecisionContextSnapshot]
+    ) -> Dict[SnapshotSignature, List[DecisionContextSnapshot]]:
+        """Group snapshots by signature, largest group first."""
+        groups: Dict[SnapshotSignature, List[DecisionContextSnapshot]] = {}
+        for snapshot in snapshots:
+            groups.setdefault(snapshot_signature(snapshot), []).append(snapshot)
+        return dict(sorted(groups.items(), key=lambda item: len(item[1]), reverse=True))
+    
+    @staticmethod
+    def get_signature_groups(db: Session) -> SnapshotSignatureGroupsResponse:
+        """
+        List decisions grouped by their latest snapshot signature.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            SnapshotSignatureGroupsResponse with group sizes, largest first
+        """
+        groups = EvaluationService.group_by_signature(
+            EvaluationService.latest_snapshots(db)
+        )
+        return SnapshotSignatureGroupsResponse(
+            total_decisions=sum(len(snapshots) for snapshots in groups.values()),
+            distinct_signatures=len(groups),
+            groups=[
+                SnapshotSignatureGroup(
+                    team_size_at_decision=signature[0],
+                    expected_users_at_decision=signature[1],
+                    timeline_at_decision=signature[2],
+                    decision_count=len(snapshots),
+                    decision_ids=[s.decision_id for s in snapshots]
+                )
+                for signature, snapshots in groups.items()
+            ]
+        )
+    
+    @staticmethod
+    def evaluate_all_decisions(db: Session) -> BatchEvaluationResponse:
+        """
+        Evaluate every decision that has a snapshot.
+        
+        Decisions whose latest snapshots share a signature get the same
+        drift result, so the score is computed once per signature and the
+        evaluation rows are inserted in bulk.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            BatchEvaluationResponse with one evaluation per decision
+            
+        Raises:
+            ValueError: If no project context exists
+        """
+        current_context = db.query(ProjectContext).order_by(
+            ProjectContext.updated_at.desc()
+        ).first()
+        
+        if not current_context:
+            raise ValueError("No project context found. Please set project context first.")
+        
+        groups = EvaluationService.group_by_signature(
+            EvaluationService.latest_snapshots(db)
+        )
+        
+        evaluated_at = datetime.utcnow()
+        rows = []
+        for snapshots in groups.values():
+            drift_score, risk_level, explanation = calculate_drift_score(
+                current_context,
+                snapshots[0]
+            )
+            rows.extend(
+                {
+                    "id": uuid.uuid4(),
+                    "decision_id": snapshot.decision_id,
+                    "drift_score": drift_score,
+                    "risk_level": risk_level,
+                    "explanation": explanation,
+                    "evaluated_at": evaluated_at,
+                }
+                for snapshot in snapshots
+            )
+        
+        if rows:
+            db.bulk_insert_mappings(DecisionEvaluation, rows)
+            db.commit()
+        
+        return BatchEvaluationResponse(
+            decisions_evaluated=len(rows),
+            distinct_signatures=len(groups),
+            evaluations=DecisionEvaluationResponseList.validate_python(rows)
+        )
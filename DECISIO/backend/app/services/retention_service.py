@@ -0,0 +1,153 @@
+"""Service for evaluation history retention and downsampling."""
+
+from datetime import datetime, timedelta
+from itertools import groupby
+from typing import Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.evaluation import DecisionEvaluation, DecisionEvaluationArchive
+
+# Rows streamed from the live table per round trip
+BATCH_SIZE = 1000
+
+# Advisory lock key that serialises compaction runs on PostgreSQL
+COMPACTION_LOCK_KEY = 0x0DEC1510
+
+
+def bucket_start(moment: datetime, bucket: str) -> datetime:
+    """Truncate a timestamp to the start of its day or ISO week."""
+    day = datetime(moment.year, moment.month, moment.day)
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def month_range(moment: datetime) -> Tuple[datetime, datetime]:
+    """Return the [start, end) bounds of the month containing a timestamp."""
+    start = datetime(moment.year, moment.month, 1)
+    if moment.month == 12:
+        return start, datetime(moment.year + 1, 1, 1)
+    return start, datetime(moment.year, moment.month + 1, 1)
+
+
+class RetentionService:
+    """Service for compacting decision evaluation history."""
+
+    @staticmethod
+    def ensure_archive_partitions(db: Session, months: Iterable[datetime]) -> None:
+        """
+        Create monthly archive partitions on PostgreSQL.
+
+        Args:
+            db: Database session
+            months: Any timestamps within the months that need a partition
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return
+        table = DecisionEvaluationArchive.__tablename__
+        for start, end in sorted({month_range(m) for m in months}):
+            db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {table}_{start:%Y_%m} "
+                f"PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+            ))
+
+    @staticmethod
+    def compact_evaluations(
+        db: Session,
+        now: Optional[datetime] = None
+    ) -> int:
+        """
+        Downsample evaluations older than the retention window.
+
+        Raw rows before the cutoff are folded into one archive row per
+        decision per bucket (the latest evaluation in that bucket) and
+        removed from the live table. The cutoff is aligned to a bucket
+        boundary so a bucket is never split across runs.
+
+        Args:
+            db: Database session
+            now: Reference time, defaults to the current UTC time
+
+        Returns:
+            Number of live rows that were compacted, or 0 if another
+            process holds the compaction lock
+        """
+        # Every worker may run its own compaction loop. On PostgreSQL only
+        # one run proceeds; the lock is released when this transaction ends.
+        # Other databases have no equivalent, so run compaction from a
+        # single process there.
+        if db.get_bind().dialect.name == "postgresql":
+            locked = db.execute(
+                text("SELECT pg_try_advisory_xact_lock(:key)"),
+                {"key": COMPACTION_LOCK_KEY}
+            ).scalar()
+            if not locked:
+                db.rollback()
+                return 0
+
+        settings = get_settings()
+        bucket = settings.EVALUATION_DOWNSAMPLE_BUCKET
+        now = now or datetime.utcnow()
+        cutoff = bucket_start(now - timedelta(days=settings.EVALUATION_RETENTION_DAYS), bucket)
+
+        old_rows = db.query(DecisionEvaluation).filter(
+            DecisionEvaluation.evaluated_at < cutoff
+        ).order_by(
+            DecisionEvaluation.decision_id,
+            DecisionEvaluation.evaluated_at
+        ).yield_per(BATCH_SIZE)
+
+        archived: List[dict] = []
+        months: Set[datetime] = set()
+        compacted = 0
+        for _, group in groupby(
+            old_rows,
+            key=lambda e: (e.decision_id, bucket_start(e.evaluated_at, bucket))
+        ):
+            rows = list(group)
+            latest = rows[-1]
+            compacted += len(rows)
+            months.add(latest.evaluated_at)
+            archived.append({
+                "id": latest.id,
+                "decision_id": latest.decision_id,
+                "drift_score": latest.drift_score,
+                "risk_level": latest.risk_level,
+                "explanation": latest.explanation,
+                "evaluated_at": latest.evaluated_at,
+                "bucket": bucket,
+                "sample_count": len(rows),
+                "max_drift_score": max(r.drift_score for r in rows),
+            })
+
+        if not archived:
+            db.rollback()
+            return 0
+
+        RetentionService.ensure_archive_partitions(db, months)
+        for i in range(0, len(archived), BATCH_SIZE):
+            db.bulk_insert_mappings(DecisionEvaluationArchive, archived[i:i + BATCH_SIZE])
+        db.query(DecisionEvaluation).filter(
+            DecisionEvaluation.evaluated_at < cutoff
+        ).delete(synchronize_session=False)
+        db.commit()
+        return compacted
+
+
+def run_compaction() -> int:
+    """Run one compaction pass with its own session."""
+    from app.core.database import get_session_factory
+
+    db = get_session_factory()()
+    try:
+        return RetentionService.compact_evaluations(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    print(f"Compacted {run_compaction()} evaluations")
@@ -0,0 +1,53 @@
+"""Shared fixtures: point the app at fresh SQLite databases for each test."""
+
+import pytest
+
+import app.core.init_db  # noqa: F401  imports every model
+from app.core import database
+from app.core.config import get_settings
+
+
+def _reset_cached_settings_and_engines() -> None:
+    """Dispose cached engines and forget cached settings."""
+    if database.get_replica_session_factories.cache_info().currsize:
+        for factory in database.get_replica_session_factories():
+            factory.kw["bind"].dispose()
+    if database.get_engine.cache_info().currsize:
+        database.get_engine().dispose()
+    for cached in (
+        get_settings,
+        database.get_engine,
+        database.get_session_factory,
+        database.get_replica_session_factories,
+    ):
+        cached.cache_clear()
+
+
+@pytest.fixture
+def configure(monkeypatch, tmp_path):
+    """
+    Return a function that sets environment settings for the app.
+
+    DATABASE_URL defaults to a SQLite file in the test's temporary
+    directory. Cached settings and engines are rebuilt on next use.
+    """
+    def _configure(**env: str) -> None:
+        env.setdefault("DATABASE_URL", f"sqlite:///{tmp_path / 'primary.db'}")
+        env.setdefault("DATABASE_REPLICA_URLS", "")
+        env.setdefault("CREATE_TABLES_ON_STARTUP", "false")
+        env.setdefault("EVALUATION_COMPACTION_INTERVAL_SECONDS", "0")
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        _reset_cached_settings_and_engines()
+
+    yield _configure
+    _reset_cached_settings_and_engines()
+
+
+@pytest.fixture
+def create_tables():
+    """Return a function that creates every table for a session factory."""
+    def _create_tables(session_factory) -> None:
+        database.Base.metadata.create_all(bind=session_factory.kw["bind"])
+
+    return _create_tables
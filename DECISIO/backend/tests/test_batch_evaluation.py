@@ -0,0 +1,111 @@
+"""Batch evaluation scores each distinct snapshot signature once."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.database import get_session_factory
+from app.models.decision import ConfidenceLevel, Decision, DecisionType
+from app.models.evaluation import DecisionContextSnapshot, DecisionEvaluation
+from app.models.project_context import ProjectContext
+from app.services import evaluation_service
+from app.services.evaluation_service import EvaluationService
+
+CREATED_AT = datetime(2026, 1, 1)
+
+# Snapshot signatures per decision, oldest first; the latest one is scored
+SNAPSHOTS = {
+    "shared a": [(4, 1000, 6)],
+    "shared b": [(4, 1000, 6)],
+    "shared c": [(4, 1000, 6)],
+    "re-snapshotted": [(4, 1000, 6), (10, 50000, 12)],
+    "alone": [(2, 100, 3)],
+    "no snapshot": [],
+}
+DISTINCT_SIGNATURES = 3
+
+
+@pytest.fixture
+def db(configure, create_tables):
+    configure()
+    create_tables(get_session_factory())
+    session = get_session_factory()()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def decisions(db):
+    """Seed project context and decisions; return {title: decision id}."""
+    db.add(ProjectContext(team_size=8, expected_users=20000, timeline_months=9))
+    ids = {}
+    for title, signatures in SNAPSHOTS.items():
+        decision = Decision(
+            title=title,
+            description="Seeded by test_batch_evaluation",
+            decision_type=DecisionType.ARCHITECTURE,
+            confidence_level=ConfidenceLevel.MEDIUM
+        )
+        db.add(decision)
+        db.flush()
+        ids[title] = decision.id
+        for i, (team_size, users, timeline) in enumerate(signatures):
+            db.add(DecisionContextSnapshot(
+                decision_id=decision.id,
+                team_size_at_decision=team_size,
+                expected_users_at_decision=users,
+                timeline_at_decision=timeline,
+                created_at=CREATED_AT + timedelta(days=i)
+            ))
+    db.commit()
+    return ids
+
+
+@pytest.fixture
+def drift_calls(monkeypatch):
+    """Record the snapshot signature of every calculate_drift_score call."""
+    calls = []
+    calculate = evaluation_service.calculate_drift_score
+
+    def counting(context, snapshot):
+        calls.append(evaluation_service.snapshot_signature(snapshot))
+        return calculate(context, snapshot)
+
+    monkeypatch.setattr(evaluation_service, "calculate_drift_score", counting)
+    return calls
+
+
+def test_scores_each_signature_once(db, decisions, drift_calls):
+    result = EvaluationService.evaluate_all_decisions(db)
+
+    assert len(drift_calls) == DISTINCT_SIGNATURES
+    assert len(set(drift_calls)) == DISTINCT_SIGNATURES
+    assert result.distinct_signatures == DISTINCT_SIGNATURES
+
+
+def test_one_evaluation_per_decision_with_a_snapshot(db, decisions, drift_calls):
+    result = EvaluationService.evaluate_all_decisions(db)
+
+    with_snapshot = {decisions[title] for title, s in SNAPSHOTS.items() if s}
+    evaluated = [e.decision_id for e in result.evaluations]
+    assert sorted(evaluated) == sorted(with_snapshot)
+    assert result.decisions_evaluated == len(with_snapshot)
+
+    stored = [e.decision_id for e in db.query(DecisionEvaluation).all()]
+    assert sorted(stored) == sorted(with_snapshot)
+    assert decisions["no snapshot"] not in stored
+
+
+def test_matches_evaluating_each_decision(db, decisions, drift_calls):
+    batch = {
+        e.decision_id: e
+        for e in EvaluationService.evaluate_all_decisions(db).evaluations
+    }
+
+    for decision_id, evaluation in batch.items():
+        single = EvaluationService.evaluate_decision(db, decision_id)
+        assert (evaluation.drift_score, evaluation.risk_level, evaluation.explanation) == (
+            single.drift_score, single.risk_level, single.explanation
+        )
+    # The re-snapshotted decision is scored from its latest snapshot
+    assert (10, 50000, 12) in drift_calls[:DISTINCT_SIGNATURES]
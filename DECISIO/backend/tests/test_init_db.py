@@ -0,0 +1,22 @@
+"""Schema creation on a database that predates the current models."""
+
+from sqlalchemy import inspect
+
+from app.core.database import get_engine
+from app.core.init_db import init_db
+from app.models.evaluation import DecisionEvaluation
+
+
+def test_init_db_adds_indexes_to_existing_tables(configure):
+    configure()
+    engine = get_engine()
+    table = DecisionEvaluation.__table__
+    table.create(bind=engine)
+    for index in table.indexes:
+        index.drop(bind=engine)
+
+    init_db()
+    init_db()  # a second run is a no-op
+
+    names = {index["name"] for index in inspect(engine).get_indexes(table.name)}
+    assert {index.name for index in table.indexes} <= names
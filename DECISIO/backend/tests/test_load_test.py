@@ -0,0 +1,21 @@
+"""Report maths of the load test harness."""
+
+from app.benchmarks.load_test import percentile
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 21))
+    assert percentile(values, 50) == 10
+    assert percentile(values, 95) == 19
+    assert percentile(values, 99) == 20
+    assert percentile(list(range(1, 101)), 7) == 7
+    # Ranks round up, never half-to-even
+    assert percentile([1, 2, 3, 4, 5], 50) == 3
+    assert percentile(list(range(1, 31)), 95) == 29
+
+
+def test_percentile_of_tiny_samples():
+    assert percentile([], 99) == 0.0
+    assert percentile([3.0], 50) == 3.0
+    assert percentile([1.0, 2.0], 50) == 1.0
+    assert percentile([1.0, 2.0], 0) == 1.0
@@ -0,0 +1,115 @@
+"""
+Read-replica routing against three local SQLite databases.
+
+The primary and the two replicas are seeded with different numbers of
+decisions, so the size of `GET /decisions` shows which database served it.
+"""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import PRIMARY_STICKY_HEADER
+from app.core.database import get_replica_session_factories, get_session_factory
+from app.main import create_app
+from app.models.decision import ConfidenceLevel, Decision, DecisionType
+
+API = "/api/v1"
+STICKY_SECONDS = 1
+
+# Decisions seeded per database; distinct so responses identify the source
+PRIMARY_DECISIONS = 3
+REPLICA_DECISIONS = (1, 2)
+
+
+def seed(session_factory, count: int) -> None:
+    """Create `count` decisions in one database."""
+    db = session_factory()
+    try:
+        for i in range(count):
+            db.add(Decision(
+                title=f"Seeded decision {i}",
+                description="Seeded by test_replica_routing",
+                decision_type=DecisionType.ARCHITECTURE,
+                confidence_level=ConfidenceLevel.MEDIUM
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def count_decisions(client: TestClient, **kwargs) -> int:
+    response = client.get(f"{API}/decisions", **kwargs)
+    response.raise_for_status()
+    return len(response.json())
+
+
+@pytest.fixture
+def api_app(configure, create_tables, tmp_path):
+    configure(
+        DATABASE_REPLICA_URLS=",".join(
+            f"sqlite:///{tmp_path / f'replica{i}.db'}" for i in (1, 2)
+        ),
+        REPLICA_STICKY_SECONDS=str(STICKY_SECONDS),
+    )
+    create_tables(get_session_factory())
+    seed(get_session_factory(), PRIMARY_DECISIONS)
+    replicas = get_replica_session_factories()
+    assert len(replicas) == 2
+    for factory, count in zip(replicas, REPLICA_DECISIONS):
+        create_tables(factory)
+        seed(factory, count)
+    return create_app()
+
+
+def write(client: TestClient) -> str:
+    """Create a decision on the primary and return the sticky marker."""
+    response = client.post(f"{API}/decisions", json={
+        "title": "Written to primary",
+        "description": "Written by test_replica_routing",
+        "decision_type": "process",
+        "confidence_level": "high",
+    })
+    response.raise_for_status()
+    return response.headers[PRIMARY_STICKY_HEADER]
+
+
+def test_reads_round_robin_across_replicas(api_app):
+    client = TestClient(api_app)
+    counts = [count_decisions(client) for _ in range(4)]
+    assert sorted(counts[:2]) == sorted(REPLICA_DECISIONS)
+    assert counts[:2] == counts[2:]
+
+
+def test_cookie_keeps_reads_on_primary_after_write(api_app):
+    client = TestClient(api_app)
+    write(client)
+    assert count_decisions(client) == PRIMARY_DECISIONS + 1
+    assert count_decisions(TestClient(api_app)) in REPLICA_DECISIONS
+
+
+def test_header_keeps_reads_on_primary_after_write(api_app):
+    client = TestClient(api_app)
+    primary_until = write(client)
+    client.cookies.clear()
+    headers = {PRIMARY_STICKY_HEADER: primary_until}
+    assert count_decisions(client, headers=headers) == PRIMARY_DECISIONS + 1
+    assert count_decisions(client) in REPLICA_DECISIONS
+
+
+def test_stickiness_expires(api_app):
+    client = TestClient(api_app)
+    primary_until = write(client)
+    client.cookies.clear()
+    time.sleep(STICKY_SECONDS + 0.2)
+    headers = {PRIMARY_STICKY_HEADER: primary_until}
+    assert count_decisions(client, headers=headers) in REPLICA_DECISIONS
+
+
+def test_far_future_header_is_ignored(api_app):
+    client = TestClient(api_app)
+    headers = {PRIMARY_STICKY_HEADER: str(time.time() + 1e9)}
+    assert count_decisions(client, headers=headers) in REPLICA_DECISIONS
+    headers = {PRIMARY_STICKY_HEADER: "1e18"}
+    assert count_decisions(client, headers=headers) in REPLICA_DECISIONS
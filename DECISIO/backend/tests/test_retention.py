@@ -0,0 +1,138 @@
+"""
+Evaluation history compaction against a local SQLite database.
+
+Seeds one evaluation every 6 hours for 200 days and compacts at a fixed
+"now", for day and week buckets.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import get_session_factory
+from app.models.decision import ConfidenceLevel, Decision, DecisionType
+from app.models.evaluation import DecisionEvaluation, DecisionEvaluationArchive, RiskLevel
+from app.main import create_app
+from app.services.retention_service import RetentionService, bucket_start, month_range
+
+RETENTION_DAYS = 90
+NOW = datetime(2026, 10, 21, 12)  # a Wednesday, mid-day
+HISTORY_HOURS = 24 * 200
+STEP_HOURS = 6
+
+
+def test_bucket_start():
+    moment = datetime(2026, 10, 21, 15, 30)
+    assert bucket_start(moment, "day") == datetime(2026, 10, 21)
+    assert bucket_start(moment, "week") == datetime(2026, 10, 19), "weeks must start on Monday"
+
+
+def test_month_range_crosses_year_end():
+    assert month_range(datetime(2026, 12, 31, 23)) == (datetime(2026, 12, 1), datetime(2027, 1, 1))
+
+
+@pytest.fixture(params=["day", "week"])
+def bucket(request, configure, create_tables):
+    configure(
+        EVALUATION_DOWNSAMPLE_BUCKET=request.param,
+        EVALUATION_RETENTION_DAYS=str(RETENTION_DAYS),
+    )
+    create_tables(get_session_factory())
+    return request.param
+
+
+@pytest.fixture
+def db(bucket):
+    session = get_session_factory()()
+    yield session
+    session.close()
+
+
+def seed_history(db, bucket: str) -> list:
+    """Seed evaluations for one decision; return (id, evaluated_at, drift_score) rows."""
+    decision = Decision(
+        title=f"Retention test ({bucket})",
+        description="Seeded by test_retention",
+        decision_type=DecisionType.PROCESS,
+        confidence_level=ConfidenceLevel.LOW
+    )
+    db.add(decision)
+    db.commit()
+
+    seeded = []
+    for hours in range(0, HISTORY_HOURS, STEP_HOURS):
+        evaluation = DecisionEvaluation(
+            decision_id=decision.id,
+            drift_score=(hours * 7) % 101,
+            risk_level=RiskLevel.LOW,
+            explanation="Seeded by test_retention",
+            evaluated_at=NOW - timedelta(hours=hours)
+        )
+        db.add(evaluation)
+        seeded.append(evaluation)
+    db.commit()
+    return [(e.id, e.evaluated_at, e.drift_score) for e in seeded]
+
+
+def test_compaction_keeps_recent_rows_and_downsamples_the_rest(db, bucket):
+    seeded = seed_history(db, bucket)
+    cutoff = bucket_start(NOW - timedelta(days=RETENTION_DAYS), bucket)
+    expected_live = [row for row in seeded if row[1] >= cutoff]
+    expected_buckets = defaultdict(list)
+    for row in seeded:
+        if row[1] < cutoff:
+            expected_buckets[bucket_start(row[1], bucket)].append(row)
+
+    compacted = RetentionService.compact_evaluations(db, now=NOW)
+    assert compacted == len(seeded) - len(expected_live)
+
+    live = db.query(DecisionEvaluation).all()
+    assert len(live) == len(expected_live)
+    assert min(e.evaluated_at for e in live) == cutoff, "cutoff not aligned to a bucket boundary"
+
+    archived = db.query(DecisionEvaluationArchive).all()
+    assert len(archived) == len(expected_buckets)
+    for row in archived:
+        assert row.bucket == bucket
+        assert row.evaluated_at < cutoff, "archive row newer than the cutoff"
+        rows = expected_buckets[bucket_start(row.evaluated_at, bucket)]
+        latest = max(rows, key=lambda r: r[1])
+        assert row.id == latest[0], "archive row is not the latest in its bucket"
+        assert row.sample_count == len(rows)
+        assert row.max_drift_score == max(r[2] for r in rows)
+
+
+def test_second_compaction_is_a_no_op(db, bucket):
+    seed_history(db, bucket)
+    assert RetentionService.compact_evaluations(db, now=NOW) > 0
+    assert RetentionService.compact_evaluations(db, now=NOW) == 0
+
+
+def test_evaluation_pages_run_from_live_rows_into_the_archive(db, bucket):
+    seeded = seed_history(db, bucket)
+    RetentionService.compact_evaluations(db, now=NOW)
+    live = db.query(DecisionEvaluation).count()
+    archived = db.query(DecisionEvaluationArchive).count()
+    decision_id = db.query(Decision.id).scalar()
+
+    client = TestClient(create_app())
+    pages = []
+    while not pages or len(pages[-1]) == 100:
+        response = client.get(
+            f"/api/v1/decisions/{decision_id}/evaluations",
+            params={"skip": 100 * len(pages)}
+        )
+        response.raise_for_status()
+        pages.append(response.json())
+    rows = [row for page in pages for row in page]
+
+    assert len(rows) == live + archived < len(seeded)
+    assert len({row["id"] for row in rows}) == len(rows)
+    assert [row["evaluated_at"] for row in rows] == sorted(
+        (row["evaluated_at"] for row in rows), reverse=True
+    )
+    assert all(row["bucket"] is None for row in rows[:live])
+    assert all(row["bucket"] == bucket for row in rows[live:])
+    assert sum(row["sample_count"] for row in rows[live:]) == len(seeded) - live
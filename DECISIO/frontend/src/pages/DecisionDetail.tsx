@@ -4,6 +4,7 @@ import {
   decisionsApi,
   evaluationApi,
   projectContextApi,
+  EVALUATIONS_PAGE_SIZE,
 } from '../services/api';
 import {
   Decision,
@@ -24,6 +25,8 @@ export default function DecisionDetail() {
   const [projectContext, setProjectContext] = useState<ProjectContext | null>(null);
   const [loading, setLoading] = useState(true);
   const [evaluating, setEvaluating] = useState(false);
+  const [hasOlderEvaluations, setHasOlderEvaluations] = useState(false);
+  const [loadingOlder, setLoadingOlder] = useState(false);
   const [showSnapshotModal, setShowSnapshotModal] = useState(false);
 
   useEffect(() => {
@@ -51,6 +54,7 @@ export default function DecisionDetail() {
           evaluationApi.getEvaluations(id),
         ]);
         setEvaluations(evaluationsData);
+        setHasOlderEvaluations(evaluationsData.length === EVALUATIONS_PAGE_SIZE);
         // Use latest snapshot (first in list, newest first)
         setSnapshot(snapshotsData.length > 0 ? snapshotsData[0] : null);
       } catch (error) {
@@ -77,6 +81,22 @@ export default function DecisionDetail() {
     }
   };
 
+  const handleLoadOlder = async () => {
+    if (!id) return;
+
+    setLoadingOlder(true);
+    try {
+      const older = await evaluationApi.getEvaluations(id, evaluations.length);
+      const seen = new Set(evaluations.map((e) => e.id));
+      setEvaluations([...evaluations, ...older.filter((e) => !seen.has(e.id))]);
+      setHasOlderEvaluations(older.length === EVALUATIONS_PAGE_SIZE);
+    } catch (error) {
+      console.error('Error loading older evaluations:', error);
+    } finally {
+      setLoadingOlder(false);
+    }
+  };
+
   const handleSnapshotCreated = () => {
     setShowSnapshotModal(false);
     loadData();
@@ -248,6 +268,13 @@ export default function DecisionDetail() {
                     <p className="text-sm opacity-90">
                       {format(new Date(evaluation.evaluated_at), 'MMM d, yyyy HH:mm')}
                     </p>
+                    {evaluation.bucket && (
+                      <p className="text-xs opacity-75 mt-1">
+                        {evaluation.bucket === 'week' ? 'Weekly' : 'Daily'} summary of{' '}
+                        {evaluation.sample_count} evaluations • peak drift{' '}
+                        {evaluation.max_drift_score}/100
+                      </p>
+                    )}
                   </div>
                   {evaluation.risk_level === RiskLevel.HIGH && (
                     <AlertTriangle className="h-5 w-5" />
@@ -259,6 +286,17 @@ export default function DecisionDetail() {
                 <p className="mt-2 text-sm">{evaluation.explanation}</p>
               </div>
             ))}
+            {hasOlderEvaluations && (
+              <div className="text-center">
+                <button
+                  onClick={handleLoadOlder}
+                  disabled={loadingOlder}
+                  className="btn btn-secondary"
+                >
+                  {loadingOlder ? 'Loading...' : 'Load older evaluations'}
+                </button>
+              </div>
+            )}
           </div>
         )}
       </div>
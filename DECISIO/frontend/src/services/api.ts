@@ -26,6 +26,32 @@ const api = axios.create({
   },
 });
 
+/**
+ * Read-your-writes with backend read replicas.
+ *
+ * After a write the backend returns X-Decisio-Primary-Until; echoing it on
+ * later requests keeps this client's reads on the primary database. A
+ * header is used instead of relying on the cookie alone so it also works
+ * when the frontend and backend are on different sites.
+ */
+const PRIMARY_STICKY_HEADER = 'X-Decisio-Primary-Until';
+let primaryUntil: string | null = null;
+
+api.interceptors.request.use((config) => {
+  if (primaryUntil) {
+    config.headers[PRIMARY_STICKY_HEADER] = primaryUntil;
+  }
+  return config;
+});
+
+api.interceptors.response.use((response) => {
+  const value = response.headers[PRIMARY_STICKY_HEADER.toLowerCase()];
+  if (value) {
+    primaryUntil = String(value);
+  }
+  return response;
+});
+
 // Decisions API
 export const decisionsApi = {
   getAll: async (): Promise<Decision[]> => {
@@ -58,6 +84,10 @@ export const projectContextApi = {
 };
 
 // Evaluation API
+
+/** Evaluations fetched per page, newest first (the backend default). */
+export const EVALUATIONS_PAGE_SIZE = 100;
+
 export const evaluationApi = {
   getSnapshots: async (
     decisionId: string
@@ -87,10 +117,13 @@ export const evaluationApi = {
   },
 
   getEvaluations: async (
-    decisionId: string
+    decisionId: string,
+    skip = 0,
+    limit = EVALUATIONS_PAGE_SIZE
   ): Promise<DecisionEvaluation[]> => {
     const response = await api.get<DecisionEvaluation[]>(
-      `/decisions/${decisionId}/evaluations`
+      `/decisions/${decisionId}/evaluations`,
+      { params: { skip, limit } }
     );
     return response.data;
   },
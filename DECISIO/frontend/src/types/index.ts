@@ -52,6 +52,10 @@ export interface DecisionEvaluation {
   risk_level: RiskLevel;
   explanation: string;
   evaluated_at: string;
+  // Set on downsampled history: the latest evaluation in its bucket
+  bucket?: 'day' | 'week' | null;
+  sample_count?: number | null;
+  max_drift_score?: number | null;
 }
 
 export interface DecisionCreate {